@@ -9,5 +9,10 @@ if __name__ == "__main__":
         "market_sim.api.app:app",
         host=os.getenv("API_HOST"),
         port=int(os.getenv("API_PORT")),
-        reload=True
-    )
\ No newline at end of file
+        reload=os.getenv("ENV") == "dev",
+        loop="uvloop",
+        http="httptools",
+        # Simulation status is held in process memory, so more than one
+        # worker only makes sense behind a shared status store
+        workers=int(os.getenv("API_WORKERS", "1"))
+    )
@@ -8,11 +8,15 @@ setup(
     install_requires=[
         "numpy>=1.24.0",
         "pandas>=2.0.0",
+        "pyarrow>=14.0.0",
         "scipy>=1.10.0",
+        "numba>=0.59.0",
         "python-dotenv>=1.0.0",
         "matplotlib>=3.8.0",
         "mplfinance>=0.12.10b0",
         "fastapi>=0.110.0",
-        "uvicorn>=0.29.0"
+        "uvicorn>=0.29.0",
+        "uvloop>=0.19.0",
+        "httptools>=0.6.0"
     ],
 )
\ No newline at end of file
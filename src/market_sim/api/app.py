@@ -1,29 +1,33 @@
 import uuid
-from fastapi import FastAPI, HTTPException
+from functools import lru_cache
+from fastapi import APIRouter, Depends, FastAPI, HTTPException
 from fastapi.responses import JSONResponse
-from src.market_sim.api.schemas import (
+from market_sim.api.schemas import (
     MarketSimulationRequest,
     SimulationResponse,
     SimulationStatus,
     MarkovJumpSimulationRequest
 )
-from src.market_sim.api.simulation_service import SimulationService
+from market_sim.api.simulation_service import SimulationService
+
+router = APIRouter()
 
-app = FastAPI(
-    title="Market Data Simulation API",
-    description="API for simulating market data including index and options",
-    version="1.0.0"
-)
 
-simulation_service = SimulationService()
+@lru_cache(maxsize=1)
+def get_service() -> SimulationService:
+    """Shared simulation service, created on first use"""
+    return SimulationService()
 
-@app.get("/health")
+@router.get("/health")
 async def health_check():
     """Health check endpoint"""
     return {"status": "healthy"}
 
-@app.post("/api/v1/simulate", response_model=SimulationResponse)
-async def simulate_market(request: MarketSimulationRequest):
+@router.post("/api/v1/simulate", response_model=SimulationResponse)
+async def simulate_market(
+    request: MarketSimulationRequest,
+    simulation_service: SimulationService = Depends(get_service)
+):
     """
     Simulate market data based on provided parameters.
     Generates index data and optionally options chain data.
@@ -42,8 +46,11 @@ async def simulate_market(request: MarketSimulationRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/v1/simulate/{simulation_id}/status", response_model=SimulationStatus)
-async def get_simulation_status(simulation_id: str):
+@router.get("/api/v1/simulate/{simulation_id}/status", response_model=SimulationStatus)
+async def get_simulation_status(
+    simulation_id: str,
+    simulation_service: SimulationService = Depends(get_service)
+):
     """Get the status of a specific simulation"""
     status = simulation_service.get_status(simulation_id)
     if status is None:
@@ -53,8 +60,11 @@ async def get_simulation_status(simulation_id: str):
         )
     return status
 
-@app.post("/api/v1/simulate/market_data", response_model=SimulationResponse)
-async def simulate_market_data(request: MarkovJumpSimulationRequest):
+@router.post("/api/v1/simulate/market_data", response_model=SimulationResponse)
+async def simulate_market_data(
+    request: MarkovJumpSimulationRequest,
+    simulation_service: SimulationService = Depends(get_service)
+):
     """Simulates market data based on provided parameters"""
     simulation_id = str(uuid.uuid4())
     try:
@@ -68,4 +78,18 @@ async def simulate_market_data(request: MarkovJumpSimulationRequest):
         return JSONResponse(
             status_code=422,
             content={"message": str(e)}
-        )
\ No newline at end of file
+        )
+
+
+def create_app() -> FastAPI:
+    """Create the API application with all routes registered"""
+    app = FastAPI(
+        title="Market Data Simulation API",
+        description="API for simulating market data including index and options",
+        version="1.0.0"
+    )
+    app.include_router(router)
+    return app
+
+
+app = create_app()
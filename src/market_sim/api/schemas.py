@@ -1,5 +1,6 @@
 from enum import Enum
 from typing import Optional
+import numpy as np
 from pydantic import BaseModel, Field, model_validator, conlist
 
 
@@ -122,11 +123,14 @@ class MarkovJumpSimulationRequest(BaseModel):
         matrix = m.transition_matrix
         regimes = m.regimes
         n = len(matrix)
+        if n == 0:
+            raise ValueError("transition_matrix must not be empty")
         if any(len(row) != n for row in matrix):
             raise ValueError("transition_matrix must be square (n × n)")
-        for i, row in enumerate(matrix):
-            if abs(sum(row) - 1.0) > 1e-6:
-                raise ValueError(f"Row {i} must sum to 1")
+        row_sums = np.asarray(matrix, dtype=np.float64).sum(axis=1)
+        bad_rows = np.flatnonzero(np.abs(row_sums - 1.0) > 1e-6)
+        if bad_rows.size:
+            raise ValueError(f"Row {bad_rows[0]} must sum to 1")
         if len(regimes) != n:
             raise ValueError("Number of regimes must equal matrix dimension")
         return m
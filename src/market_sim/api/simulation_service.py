@@ -11,7 +11,7 @@ from market_sim.api.schemas import (
     StorageType,
     MarkovJumpSimulationRequest
 )
-from market_sim.config.config_manager import ConfigManager
+from market_sim.config.config_manager import get_config
 from market_sim.models.gbm_model import GBMModel
 from market_sim.models.jump_diffusion_model import JumpDiffusionModel
 from market_sim.models.gbm_jd_model import GBM_JD_Model
@@ -21,17 +21,18 @@ from market_sim.storage.local_storage import LocalStorage
 
 
 class SimulationService:
+    _MODEL_MAP = {
+        MarketType.VOLATILE: JumpDiffusionModel,
+        MarketType.GBM: GBMModel,
+    }
+
     def __init__(self):
         self._simulations: Dict[str, SimulationStatus] = {}
-        self._config = ConfigManager()
+        self._config = get_config()
         
     def _create_model(self, market_type: MarketType):
         """Create appropriate model based on market type"""
-        if market_type in [MarketType.VOLATILE]:
-            return JumpDiffusionModel(self._config)
-        elif market_type in [MarketType.GBM]:
-            return GBMModel(self._config)
-        return GBM_JD_Model(self._config)
+        return self._MODEL_MAP.get(market_type, GBM_JD_Model)(self._config)
     
     def _get_storage(self, storage_type: StorageType) -> StorageInterface:
         """Get storage implementation based on type"""
@@ -48,12 +49,9 @@ class SimulationService:
         if len(prices) == 0:
             return False
             
-        # Check for NaN or infinite values
-        if np.any(np.isnan(prices)) or np.any(np.isinf(prices)):
+        # Check for NaN or infinite values in a single pass
+        if not np.isfinite(prices).all():
             return False
-            
-        # Calculate returns
-        returns = np.diff(prices) / prices[:-1]
         
         # Market type specific validation
         if market_type == MarketType.BULLISH:
@@ -69,8 +67,9 @@ class SimulationService:
                 return False
                 
         elif market_type == MarketType.RANGE_BOUND:
-            # For range-bound, expect limited deviation from initial price
-            max_deviation = np.abs(prices - prices[0]).max() / prices[0]
+            # For range-bound, expect limited deviation from initial price;
+            # the largest deviation is at either the highest or lowest price
+            max_deviation = max(prices.max() - prices[0], prices[0] - prices.min()) / prices[0]
             if max_deviation > 0.2:  # 20% max deviation
                 return False
                 
@@ -93,11 +92,24 @@ class SimulationService:
         try:
             # Create model based on market type
             model = self._create_model(market_type="DEFAULT")
-            index_data, options_data = model.simulate(
-                params=params
+            index_data, options_data = await asyncio.to_thread(
+                model.simulate, params=params
+            )
+
+            # Save index and options data concurrently, off the event loop
+            storage = self._get_storage(StorageType(params.storage_type))
+            storage_path = params.output_path
+            await asyncio.gather(
+                asyncio.to_thread(storage.save, f"{storage_path}/index.parquet", index_data),
+                asyncio.to_thread(storage.save, f"{storage_path}/options.parquet", options_data)
             )
 
-            ## TBD: Save Index, Options Data
+            # Update simulation status
+            self._simulations[simulation_id].status = "completed"
+            self._simulations[simulation_id].progress = 100.0
+            self._simulations[simulation_id].storage_path = storage_path
+
+            return storage_path
 
         except Exception as e:
             self._simulations[simulation_id].status = "failed"
@@ -112,6 +124,22 @@ class SimulationService:
         """
         Start a new market simulation with the given parameters.
         Returns the storage path where results will be saved.
+
+        The simulation runs in a worker thread so the event loop stays
+        free to serve other requests.
+        """
+        return await asyncio.to_thread(
+            self.start_simulation_sync, simulation_id, params
+        )
+
+    def start_simulation_sync(
+        self,
+        simulation_id: str,
+        params: MarketSimulationRequest
+    ) -> str:
+        """
+        Run a market simulation with the given parameters to completion.
+        Returns the storage path where results were saved.
         """
         self._simulations[simulation_id] = SimulationStatus(
             simulation_id=simulation_id,
@@ -133,7 +161,7 @@ class SimulationService:
             max_attempts = 3
             for attempt in range(max_attempts):
                 # Run simulation
-                prices = await self._run_simulation(
+                prices = self._run_simulation(
                     model=model,
                     initial_value=params.initial_value,
                     drift=drift,
@@ -201,7 +229,7 @@ class SimulationService:
             self._simulations[simulation_id].error_message = str(e)
             raise
     
-    async def _run_simulation(
+    def _run_simulation(
         self,
         model,
         initial_value: float,
@@ -1,5 +1,6 @@
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 
 
@@ -87,4 +88,10 @@ class ConfigManager:
         try:
             return float(value)
         except ValueError:
-            raise ValueError(f"Invalid numeric value for {key}: {value}")
\ No newline at end of file
+            raise ValueError(f"Invalid numeric value for {key}: {value}")
+
+
+@lru_cache(maxsize=1)
+def get_config() -> ConfigManager:
+    """Get the shared configuration, read from the environment on first use."""
+    return ConfigManager()
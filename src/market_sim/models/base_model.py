@@ -38,7 +38,12 @@ class BaseModel(ABC):
         """
         pass
 
-    def _validate_parameters(self, S0: float, T: float, n_steps: int, paths: int):
+    def _get_rng(self, seed: Optional[int] = None) -> np.random.Generator:
+        """Create the random number generator for a simulation run."""
+        return np.random.Generator(np.random.SFC64(seed))
+
+    @staticmethod
+    def _validate_parameters(S0: float, T: float, n_steps: int, paths: int):
         """Validate simulation parameters."""
         if S0 <= 0:
             raise ValueError("Initial price (S0) must be positive")
@@ -1,103 +1,70 @@
+import math
 import numpy as np
+from functools import lru_cache
 from typing import Optional
 
 from market_sim.models.base_model import BaseModel
+from market_sim.models.kernels import regime_jump_bars
+from market_sim.models.options import BlackScholesModel
 import pandas as pd
-from scipy.stats import norm
-from py_vollib.black_scholes_merton.greeks.analytical import delta
-from datetime import time, datetime, timedelta
+from datetime import timedelta
+
+
+@lru_cache(maxsize=8)
+def _trading_minutes(periods: int) -> pd.DatetimeIndex:
+    """First ``periods`` trading minutes (09:15-15:29, weekdays) from 2025-01-03."""
+    session = pd.timedelta_range(start="09:15:00", end="15:29:00", freq="min")
+    days = pd.bdate_range(start="2025-01-03", periods=math.ceil(periods / len(session)))
+    minutes = days.to_numpy()[:, None] + session.to_numpy()[None, :]
+    return pd.DatetimeIndex(minutes.ravel()[:periods])
 
 
 class GBM_JD_Model(BaseModel):
     """Geometric Brownian Motion model implementation."""
 
-    def _get_next_expiry(self, dt):
+    def __init__(self, config):
+        """Initialize model with configuration and an option pricer."""
+        super().__init__(config)
+        self._pricer = BlackScholesModel()
+
+    def _get_next_expiries(self, timestamps):
         # Thursday corresponds to weekday 3 (Monday is 0)
-        days_ahead = (3 - dt.weekday()) % 7
+        days_ahead = (3 - timestamps.weekday) % 7
         # If today is Thursday, move to next Thursday (7 days later)
-        if days_ahead == 0:
-            days_ahead = 7
-        return (dt + timedelta(days=days_ahead)).date()
-
-    def _get_adjusted_sigma(self, base_sigma, previous_close, previous_sma):
-        # Use small random factor when price is far from SMA, else large volatility
-        v_small = np.random.normal(0, 1)
-        v_large = np.random.normal(0, 3)
-        w = 0.01
-
-        if previous_sma is not np.nan and abs(previous_close - previous_sma) / previous_close < 0.001:
-            return base_sigma * (1 + (w * v_large))
-        return base_sigma * (1 + (w * v_small))
-
-    def _black_scholes_price(self, S, K, T, r, sigma, option):
-        d1 = (np.log(S/K) + (r + 0.5*sigma**2)*T) / (sigma * np.sqrt(T))
-        d2 = d1 - sigma * np.sqrt(T)
-
-        if option == 'call':
-            price = S * norm.cdf(d1) - K * np.exp(-r*T) * norm.cdf(d2)
-        else:  # put
-            price = K * np.exp(-r*T) * norm.cdf(-d2) - S * norm.cdf(-d1)
-        return np.round(price, decimals=3)
-    
-    def _simulate_options_chain(self, timestamp, spot_price, strikes, sigma):
-        expiry_date = self._get_next_expiry(dt=timestamp)
-        tte=((datetime.combine(expiry_date, time(15, 29))-timestamp).total_seconds())/(365*24*60*60)
-        options_chain = []
-        for strike in strikes:
-            options_chain.append({
-                "DateTime": timestamp,
-                "Strike": strike,
-                "StrikeType": "CE",
-                "Close": self._black_scholes_price(
-                    S=spot_price,
-                    K=strike,
-                    r=0.065,
-                    T=tte,
-                    sigma=sigma,
-                    option="call"
-                ),
-                "Delta": delta(
-                    S=spot_price,
-                    K=strike,
-                    r=0.065,
-                    t=tte,
-                    sigma=sigma,
-                    flag='c',
-                    q=0
-                ), 
-                "Close_index": spot_price,
-                "ExpiryDate": expiry_date
-            })
-
-            options_chain.append({
-                "DateTime": timestamp,
-                "Strike": strike,
-                "StrikeType": "PE",
-                "Close": self._black_scholes_price(
-                    S=spot_price,
-                    K=strike,
-                    r=0.065,
-                    T=tte,
-                    sigma=sigma,
-                    option="put"
-                ),
-                "Delta": delta(
-                    S=spot_price,
-                    K=strike,
-                    r=0.065,
-                    t=tte,
-                    sigma=sigma,
-                    flag='p',
-                    q=0
-                ),
-                "Close_index": spot_price,
-                "ExpiryDate": expiry_date
-            })
-
-        return pd.DataFrame(options_chain)
+        days_ahead = np.where(days_ahead == 0, 7, days_ahead)
+        expiries = timestamps.normalize() + pd.to_timedelta(days_ahead, unit="D")
+        # Time to expiry in years, measured to the 15:29 close of expiry day
+        tte = (
+            (expiries + timedelta(hours=15, minutes=29)) - timestamps
+        ).total_seconds().to_numpy() / (365*24*60*60)
+        return expiries.date, tte
+
+    def _simulate_options_chain(self, spot_prices, strike_grid, ttes, sigmas, prices_out, deltas_out):
+        """
+        Price the option chains of a run of bars into preallocated row buffers.
+
+        ``strike_grid`` holds one row of strikes per bar. Rows of the buffers
+        alternate CE/PE per strike, so ``prices_out`` and ``deltas_out`` must
+        hold two entries per strike and bar.
+        """
+        r = 0.065
+        calls, puts, call_deltas, put_deltas = self._pricer.price_chain_with_delta(
+            S=spot_prices[:, None],
+            K=strike_grid,
+            T=ttes[:, None],
+            r=r,
+            sigma=sigmas[:, None]
+        )
+
+        prices_out = prices_out.reshape(len(spot_prices), -1)
+        deltas_out = deltas_out.reshape(len(spot_prices), -1)
+        prices_out[:, 0::2] = calls
+        prices_out[:, 1::2] = puts
+        deltas_out[:, 0::2] = call_deltas
+        deltas_out[:, 1::2] = put_deltas
 
     def _simulate_market(self, S0, regimes, transition_matrix, T, dt,
-                    lambda_jump, mu_jump, sigma_jump, steps=1, sma_length=30):
+                    lambda_jump, mu_jump, sigma_jump, steps=1, sma_length=30, seed=None):
         """
         Simulate OHLC market data with drift adjustments, jumps, and regime switching.
 
@@ -105,106 +72,71 @@ class GBM_JD_Model(BaseModel):
         -----------
         steps : int
             Number of intra-day steps to simulate for each main time step (dt).
+        seed : int, optional
+            Random seed for reproducibility
         """
         N = int(T / dt)
 
         # Minute-frequency index over trading days
-        potential_dates = (
-            pd.date_range(
-                start="2025-01-03 09:15",
-                periods=(N+1)*10,
-                freq="T"
-            )
-            .to_series()
-            .between_time("09:15", "15:29")
-            .loc[lambda s: s.index.weekday < 5]
-            .index
+        dates = _trading_minutes(N + 1)
+
+        # Flatten regime parameters for the compiled kernel
+        mus = np.array([regime.mu * (1 + regime.theta) for regime in regimes])
+        sigmas = np.array([regime.sigma for regime in regimes])
+        transition_cdf = np.cumsum(transition_matrix, axis=1)
+        transition_cdf /= transition_cdf[:, -1:]
+
+        # Draw all randomness for the run up front
+        rng = self._get_rng(seed)
+        regime_u = rng.random(N)
+        v_small = rng.standard_normal(N)
+        v_large = rng.normal(0, 3, size=N)
+        Z = rng.standard_normal((N, steps))
+        jump_u = rng.random(N)
+        log_jumps = rng.normal(mu_jump, sigma_jump, size=N)
+
+        opens, highs, lows, closes, regime_history, sigma_history, ema = regime_jump_bars(
+            S0, mus, sigmas, transition_cdf, lambda_jump * dt, dt / steps, sma_length,
+            regime_u, v_small, v_large, Z, jump_u, log_jumps
         )
 
-        dates = potential_dates[0:N+1]
-        opens = np.zeros(N + 1)
-        highs = np.zeros(N + 1)
-        lows = np.zeros(N + 1)
-        closes = np.zeros(N + 1)
-        regime_history = np.zeros(N + 1, dtype=int)
-        ema = np.full(N + 1, np.nan)
-        sigma_history = np.zeros(N + 1)
-        
-        # Initialize first values
-        opens[0] = S0
-        closes[0] = S0
-        highs[0] = S0
-        lows[0] = S0
-        regime_history[0] = 0  # Start with first regime
-        sigma_history[0] = regimes[regime_history[0]].sigma
-        
-        current_regime = 0
-        
-        options_master = pd.DataFrame()
-        for t in range(1, N + 1):
-            # Regime switching
-            current_regime = np.random.choice(len(regimes), p=transition_matrix[current_regime])
-            regime_history[t] = current_regime
-            
-            # Get current regime parameters
-            regime = regimes[current_regime]
-            theta = regime.theta
-            mu = regime.mu * (1 + theta)
-            sigma = self._get_adjusted_sigma(
-                base_sigma=regime.sigma,
-                previous_close=closes[t-1],
-                previous_sma=ema[t-1]
-            )
-            sigma_history[t] = sigma
-
-            # Open is previous close
-            opens[t] = closes[t-1]
-            
-            # Simulate intra-day price path
-            sub_dt = dt / steps
-            current_price = opens[t]
-            intra_prices = [current_price]
-            
-            for _ in range(steps):
-                Z = np.random.normal()
-                drift = (mu - 0.5 * sigma**2) * sub_dt
-                vol = sigma * np.sqrt(sub_dt) * Z
-                current_price *= np.exp(drift + vol)
-                intra_prices.append(current_price)
-            
-            pre_jump_close = current_price
-            
-            # Check for jump event
-            if np.random.uniform() < lambda_jump * dt:
-                jump_multiplier = np.exp(np.random.normal(mu_jump, sigma_jump))
-                closes[t] = pre_jump_close * jump_multiplier
-            else:
-                closes[t] = pre_jump_close
-            
-            # Calculate high and low including jump effect
-            day_high = max(intra_prices)
-            day_low = min(intra_prices)
-            highs[t] = max(day_high, closes[t])
-            lows[t] = min(day_low, closes[t])
-
-            if t >= sma_length :
-                closes_ema = pd.Series(closes).ewm(span=sma_length, adjust=False).mean().to_numpy()
-                ema[t] = closes_ema[t-1]
-            
-            ## Generating Options Chain
-            # — new 50-point grid for 50 strikes —
-            center = int(np.round(closes[t] / 50) * 50)     # round spot to nearest 50 :contentReference[oaicite:3]{index=3}
-            half = 25
-            offsets = np.arange(-half, half, 1) * 50  # 50-point steps :contentReference[oaicite:4]{index=4}
-            strikes = np.sort(center + offsets).tolist()
-
-            options_chain = self._simulate_options_chain(
-                timestamp=dates[t],
-                spot_price=closes[t],
-                strikes=strikes,
-                sigma=sigma
-            )
-            options_master = pd.concat([options_master, options_chain], ignore_index=True)
+        expiry_dates, ttes = self._get_next_expiries(dates)
+
+        # — new 50-point grid for 50 strikes —
+        half = 25
+        chain_rows = 2 * (2 * half)
+        offsets = np.arange(-half, half, dtype=np.int64) * 50  # 50-point steps :contentReference[oaicite:4]{index=4}
+        # Round every spot to the nearest 50 and lay the grid around it :contentReference[oaicite:3]{index=3}
+        centers = np.round(closes[1:] / 50).astype(np.int64) * 50
+        strike_grid = centers[:, None] + offsets
+        option_strikes = np.repeat(strike_grid.ravel(), 2)
+        option_prices = np.empty(N * chain_rows)
+        option_deltas = np.empty(N * chain_rows)
+
+        ## Generating Options Chains
+        # Chains depend only on each bar's spot and sigma, so every bar is
+        # priced in one call; the compiled kernel spreads bars across cores
+        self._simulate_options_chain(
+            spot_prices=closes[1:],
+            strike_grid=strike_grid,
+            ttes=ttes[1:],
+            sigmas=sigma_history[1:],
+            prices_out=option_prices,
+            deltas_out=option_deltas
+        )
+
+        options_master = pd.DataFrame({
+            "DateTime": np.repeat(dates[1:], chain_rows),
+            "Strike": option_strikes,
+            "StrikeType": pd.Categorical.from_codes(
+                np.tile(np.array([0, 1], dtype=np.int8), N * chain_rows // 2),
+                categories=["CE", "PE"]
+            ),
+            "Close": np.round(option_prices, decimals=3),
+            "Delta": option_deltas,
+            "Close_index": np.repeat(closes[1:], chain_rows),
+            "ExpiryDate": np.repeat(expiry_dates[1:], chain_rows)
+        })
 
         index_master = pd.DataFrame({
             'DateTime': dates,
@@ -217,7 +149,7 @@ class GBM_JD_Model(BaseModel):
             'Close_EMA': ema})
         return index_master, options_master
 
-    def simulate(self, params: type) -> np.ndarray:
+    def simulate(self, params: type, seed: Optional[int] = None) -> np.ndarray:
         """
         Simulate price paths using Geometric Brownian Motion.
         
@@ -249,6 +181,7 @@ class GBM_JD_Model(BaseModel):
             lambda_jump=params.lambda_jump, 
             mu_jump=params.mu_jump, 
             sigma_jump=params.sigma_jump, 
-            steps=params.steps
+            steps=params.steps,
+            seed=seed
         )
         return index, options        
\ No newline at end of file
@@ -1,7 +1,9 @@
+import math
 import numpy as np
 from typing import Optional
 
 from market_sim.models.base_model import BaseModel
+from market_sim.models.kernels import gbm_paths
 
 
 class GBMModel(BaseModel):
@@ -32,24 +34,22 @@ class GBMModel(BaseModel):
         """
         self._validate_parameters(S0, T, n_steps, paths)
         
-        if seed is not None:
-            np.random.seed(seed)
+        rng = self._get_rng(seed)
         
         dt = T / n_steps
         drift = self.config.default_drift
         vol = self.config.default_volatility
         
-        # Generate random normal variables
-        Z = np.random.normal(size=(paths, n_steps))
+        # Generate random normal variables; single precision is ample for the
+        # shocks, the kernel accumulates log prices in double precision
+        Z = rng.standard_normal((paths, n_steps), dtype=np.float32)
+        
+        # Per-step drift and volatility are constant along the path
+        drift_dt = (drift - 0.5 * vol**2) * dt
+        vol_sqrt_dt = vol * math.sqrt(dt)
         
         # Initialize price paths array
-        S = np.zeros((paths, n_steps + 1))
-        S[:, 0] = S0
+        S = np.empty((paths, n_steps + 1))
         
         # Simulate paths using the closed-form solution
-        for t in range(n_steps):
-            S[:, t + 1] = S[:, t] * np.exp(
-                (drift - 0.5 * vol**2) * dt + vol * np.sqrt(dt) * Z[:, t]
-            )
-        
-        return S
\ No newline at end of file
+        return gbm_paths(S0, drift_dt, vol_sqrt_dt, Z, S)
\ No newline at end of file
@@ -1,7 +1,9 @@
+import math
 import numpy as np
 from typing import Optional
 
 from market_sim.models.base_model import BaseModel
+from market_sim.models.kernels import jump_diffusion_paths
 
 
 class JumpDiffusionModel(BaseModel):
@@ -32,8 +34,7 @@ class JumpDiffusionModel(BaseModel):
         """
         self._validate_parameters(S0, T, n_steps, paths)
         
-        if seed is not None:
-            np.random.seed(seed)
+        rng = self._get_rng(seed)
         
         dt = T / n_steps
         drift = self.config.default_drift
@@ -42,28 +43,24 @@ class JumpDiffusionModel(BaseModel):
         mu_j = self.config.default_jump_mean
         sigma_j = self.config.default_jump_volatility
         
-        # Initialize arrays
-        S = np.zeros((paths, n_steps + 1))
-        S[:, 0] = S0
-        
         # Generate random variables for diffusion
-        Z = np.random.normal(size=(paths, n_steps))
+        Z = rng.standard_normal((paths, n_steps))
         
-        # Generate Poisson random variables for jump times
-        N = np.random.poisson(lambda_j * dt, size=(paths, n_steps))
+        # Jumps are rare, so draw them as a sparse set of events: the total
+        # count over the grid, a uniform (path, step) cell for each event and
+        # one log jump size per event, summed into the cells they land in
+        n_cells = paths * n_steps
+        n_jumps = rng.poisson(lambda_j * dt * n_cells)
+        cells = rng.integers(0, n_cells, size=n_jumps)
+        sizes = rng.normal(mu_j, sigma_j, size=n_jumps)
+        jumps = np.bincount(cells, weights=sizes, minlength=n_cells).reshape(paths, n_steps)
         
-        # Generate random variables for jump sizes
-        Y = np.random.normal(mu_j, sigma_j, size=(paths, n_steps))
+        # Per-step drift and volatility are constant along the path
+        drift_dt = (drift - 0.5 * vol**2) * dt
+        vol_sqrt_dt = vol * math.sqrt(dt)
         
-        # Simulate paths
-        for t in range(n_steps):
-            # Diffusion component
-            diffusion = (drift - 0.5 * vol**2) * dt + vol * np.sqrt(dt) * Z[:, t]
-            
-            # Jump component
-            jumps = N[:, t] * Y[:, t]
-            
-            # Combine diffusion and jumps
-            S[:, t + 1] = S[:, t] * np.exp(diffusion + jumps)
+        # Initialize price paths array
+        S = np.empty((paths, n_steps + 1))
         
-        return S
\ No newline at end of file
+        # Accumulate diffusion and jumps in log space, one path per thread
+        return jump_diffusion_paths(S0, drift_dt, vol_sqrt_dt, Z, jumps, S)
@@ -0,0 +1,267 @@
+import functools
+import math
+import threading
+from typing import Callable, ParamSpec, TypeVar
+
+import numba
+import numpy as np
+from numba import njit, prange
+
+
+# The simulations launch parallel=True kernels from asyncio.to_thread worker
+# threads. Under TBB the interpreter then hangs at shutdown, so the workqueue
+# layer is pinned before any kernel runs. Workqueue aborts the whole process
+# when two Python threads enter parallel kernels at once, so entry to those
+# kernels is serialized; each call still spreads its own work across all cores.
+# numba.config fills its settings in at runtime, hence the ignore.
+numba.config.THREADING_LAYER = "workqueue"  # type: ignore[attr-defined]
+_parallel_kernel_lock = threading.Lock()
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def _serialized(kernel: Callable[P, R]) -> Callable[P, R]:
+    """Wrap a parallel kernel so only one Python thread runs it at a time."""
+    @functools.wraps(kernel)
+    def run(*args: P.args, **kwargs: P.kwargs) -> R:
+        with _parallel_kernel_lock:
+            return kernel(*args, **kwargs)
+    return run
+
+
+@_serialized
+@njit(parallel=True, fastmath=True, cache=True)
+def gbm_paths(S0: float, drift: float, vol: float, Z: np.ndarray,
+              out: np.ndarray) -> np.ndarray:
+    """
+    Fill price paths of a Geometric Brownian Motion.
+
+    Parameters:
+    -----------
+    S0 : float
+        Initial price
+    drift : float
+        Per-step log drift, (mu - 0.5 * sigma**2) * dt
+    vol : float
+        Per-step log volatility, sigma * sqrt(dt)
+    Z : np.ndarray
+        Standard normal draws of shape (paths, n_steps), float32 or float64
+    out : np.ndarray
+        Output array of shape (paths, n_steps + 1)
+
+    Returns:
+    --------
+    np.ndarray
+        ``out``, filled with the simulated prices
+    """
+    paths, n_steps = Z.shape
+    log_S0 = math.log(S0)
+    for i in prange(paths):
+        log_price = log_S0
+        out[i, 0] = S0
+        for t in range(n_steps):
+            log_price += drift + vol * Z[i, t]
+            out[i, t + 1] = math.exp(log_price)
+    return out
+
+
+@_serialized
+@njit(parallel=True, fastmath=True, cache=True)
+def jump_diffusion_paths(S0: float, drift: float, vol: float, Z: np.ndarray,
+                         jumps: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Fill price paths of a Merton Jump-Diffusion.
+
+    Parameters:
+    -----------
+    S0 : float
+        Initial price
+    drift : float
+        Per-step log drift, (mu - 0.5 * sigma**2) * dt
+    vol : float
+        Per-step log volatility, sigma * sqrt(dt)
+    Z : np.ndarray
+        Standard normal draws of shape (paths, n_steps)
+    jumps : np.ndarray
+        Summed log jump sizes of shape (paths, n_steps), zero where no jump
+    out : np.ndarray
+        Output array of shape (paths, n_steps + 1)
+
+    Returns:
+    --------
+    np.ndarray
+        ``out``, filled with the simulated prices
+    """
+    paths, n_steps = Z.shape
+    log_S0 = math.log(S0)
+    for i in prange(paths):
+        log_price = log_S0
+        out[i, 0] = S0
+        for t in range(n_steps):
+            log_price += drift + vol * Z[i, t] + jumps[i, t]
+            out[i, t + 1] = math.exp(log_price)
+    return out
+
+
+@njit(cache=True)
+def regime_jump_bars(S0: float, mus: np.ndarray, sigmas: np.ndarray,
+                     transition_cdf: np.ndarray, jump_prob: float,
+                     sub_dt: float, sma_length: int, regime_u: np.ndarray,
+                     v_small: np.ndarray, v_large: np.ndarray, Z: np.ndarray,
+                     jump_u: np.ndarray, log_jumps: np.ndarray):
+    """
+    Simulate OHLC bars of a regime-switching jump diffusion.
+
+    Each bar switches regime by inverting the transition CDF of the
+    current regime, integrates a GBM path over the intra-bar steps from
+    the previous close, and applies a jump at the close with probability
+    ``jump_prob``. Volatility is scaled up when the previous close sits
+    within 0.1% of its EMA.
+
+    Parameters:
+    -----------
+    S0 : float
+        Initial price
+    mus : np.ndarray
+        Drift of each regime, already adjusted by its theta
+    sigmas : np.ndarray
+        Base volatility of each regime
+    transition_cdf : np.ndarray
+        Row-wise cumulative regime transition matrix, last column 1.0
+    jump_prob : float
+        Probability of a jump per bar, lambda_jump * dt
+    sub_dt : float
+        Length of an intra-bar step in years
+    sma_length : int
+        Span of the close EMA and number of bars before it is published
+    regime_u : np.ndarray
+        Uniform draws of shape (N,) for regime switching
+    v_small, v_large : np.ndarray
+        Normal draws of shape (N,) for calm and excited volatility
+    Z : np.ndarray
+        Standard normal draws of shape (N, steps) for the intra-bar path
+    jump_u : np.ndarray
+        Uniform draws of shape (N,) deciding whether a bar jumps
+    log_jumps : np.ndarray
+        Normal draws of shape (N,) for log jump sizes
+
+    Returns:
+    --------
+    tuple of np.ndarray
+        opens, highs, lows, closes, regime history, sigma history and
+        close EMA, each of shape (N + 1,)
+    """
+    N, steps = Z.shape
+    n_regimes = mus.shape[0]
+    alpha = 2.0 / (sma_length + 1.0)
+    sqrt_sub_dt = math.sqrt(sub_dt)
+
+    opens = np.empty(N + 1)
+    highs = np.empty(N + 1)
+    lows = np.empty(N + 1)
+    closes = np.empty(N + 1)
+    regime_history = np.zeros(N + 1, dtype=np.int64)
+    sigma_history = np.empty(N + 1)
+    ema = np.full(N + 1, np.nan)
+
+    opens[0] = S0
+    highs[0] = S0
+    lows[0] = S0
+    closes[0] = S0
+    sigma_history[0] = sigmas[0]
+
+    current_regime = 0
+    running_ema = S0
+    for t in range(1, N + 1):
+        # Regime switching
+        u = regime_u[t - 1]
+        next_regime = 0
+        while (next_regime < n_regimes - 1
+               and u >= transition_cdf[current_regime, next_regime]):
+            next_regime += 1
+        current_regime = next_regime
+        regime_history[t] = current_regime
+
+        previous_close = closes[t - 1]
+        previous_ema = ema[t - 1]
+        if (not np.isnan(previous_ema)
+                and abs(previous_close - previous_ema) / previous_close < 0.001):
+            sigma = sigmas[current_regime] * (1 + 0.01 * v_large[t - 1])
+        else:
+            sigma = sigmas[current_regime] * (1 + 0.01 * v_small[t - 1])
+        sigma_history[t] = sigma
+
+        # Intra-bar path starting from the previous close
+        opens[t] = previous_close
+        drift = (mus[current_regime] - 0.5 * sigma * sigma) * sub_dt
+        vol = sigma * sqrt_sub_dt
+        price = previous_close
+        high = price
+        low = price
+        for k in range(steps):
+            price *= math.exp(drift + vol * Z[t - 1, k])
+            high = max(high, price)
+            low = min(low, price)
+
+        # Jump at the close
+        if jump_u[t - 1] < jump_prob:
+            price *= math.exp(log_jumps[t - 1])
+        closes[t] = price
+        highs[t] = max(high, price)
+        lows[t] = min(low, price)
+
+        # EMA of closes up to the previous bar
+        if t >= sma_length:
+            ema[t] = running_ema
+        running_ema = alpha * price + (1.0 - alpha) * running_ema
+
+    return opens, highs, lows, closes, regime_history, sigma_history, ema
+
+
+@njit(inline='always')
+def _norm_cdf(x: float) -> float:
+    """Standard normal CDF, accurate to double precision in both tails."""
+    return 0.5 * math.erfc(-x / math.sqrt(2.0))
+
+
+@_serialized
+@njit(parallel=True, fastmath=True, cache=True)
+def black_scholes_chain(S: np.ndarray, K: np.ndarray, T: np.ndarray, r: float,
+                        sigma: np.ndarray, calls: np.ndarray, puts: np.ndarray,
+                        call_deltas: np.ndarray):
+    """
+    Price rows of Black-Scholes option chains.
+
+    Row ``i`` holds the strikes of one chain with spot ``S[i]``, expiry
+    ``T[i]`` and volatility ``sigma[i]``; rows are priced in parallel.
+
+    Parameters:
+    -----------
+    S : np.ndarray
+        Spot price per row, shape (rows,)
+    K : np.ndarray
+        Strike prices, shape (rows, strikes)
+    T : np.ndarray
+        Time to expiry in years per row, shape (rows,)
+    r : float
+        Risk-free interest rate
+    sigma : np.ndarray
+        Volatility per row, shape (rows,)
+    calls, puts, call_deltas : np.ndarray
+        Output arrays of shape (rows, strikes)
+    """
+    rows, strikes = K.shape
+    for i in prange(rows):
+        sigma_sqrt_T = sigma[i] * math.sqrt(T[i])
+        log_drift = (r + 0.5 * sigma[i] * sigma[i]) * T[i]
+        discount = math.exp(-r * T[i])
+        for j in range(strikes):
+            d1 = (math.log(S[i] / K[i, j]) + log_drift) / sigma_sqrt_T
+            d2 = d1 - sigma_sqrt_T
+            Nd1 = _norm_cdf(d1)
+            discounted_K = K[i, j] * discount
+            calls[i, j] = S[i] * Nd1 - discounted_K * _norm_cdf(d2)
+            # N(-d) rather than 1 - N(d), which cancels in the put tail
+            puts[i, j] = discounted_K * _norm_cdf(-d2) - S[i] * _norm_cdf(-d1)
+            call_deltas[i, j] = Nd1
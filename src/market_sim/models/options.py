@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import List
+from typing import Tuple, Union
 import numpy as np
-from scipy.stats import norm
+
+from market_sim.models.kernels import black_scholes_chain
 
 
 class OptionType(str, Enum):
@@ -13,9 +14,9 @@ class OptionType(str, Enum):
 @dataclass
 class OptionChain:
     """Container for option chain data."""
-    strikes: List[float]
-    calls: List[float]
-    puts: List[float]
+    strikes: np.ndarray
+    calls: np.ndarray
+    puts: np.ndarray
     expiry_days: int
 
 
@@ -65,19 +66,100 @@ class BlackScholesModel:
         float
             Option price
         """
-        self._validate_parameters(S, K, T, sigma)
-        
-        # Calculate d1 and d2
-        d1 = (np.log(S/K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        d2 = d1 - sigma * np.sqrt(T)
+        calls, puts = self.price_chain(S=S, K=np.array([K]), T=T, r=r, sigma=sigma)
         
         if option_type == OptionType.CALL:
-            price = S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+            price = calls[0]
         else:  # PUT
-            price = K * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
+            price = puts[0]
             
         return float(price)
 
+    def price_chain(
+        self,
+        S: float,
+        K: np.ndarray,
+        T: float,
+        r: float,
+        sigma: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate call and put prices for a whole strike grid at once.
+        
+        Parameters:
+        -----------
+        S : float
+            Current stock price
+        K : np.ndarray
+            Strike prices
+        T : float
+            Time to expiry in years
+        r : float
+            Risk-free interest rate
+        sigma : float
+            Volatility
+            
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            Call and put prices, one per strike
+        """
+        calls, puts, _, _ = self.price_chain_with_delta(S=S, K=K, T=T, r=r, sigma=sigma)
+        return calls, puts
+
+    def price_chain_with_delta(
+        self,
+        S: Union[float, np.ndarray],
+        K: np.ndarray,
+        T: Union[float, np.ndarray],
+        r: float,
+        sigma: Union[float, np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate call and put prices together with their deltas.
+        
+        With no dividend yield the call delta is N(d1) and the put delta is
+        N(d1) - 1, so both come from the CDF already evaluated for pricing.
+        K may also be a (rows, strikes) grid of chains, with spot, expiry and
+        volatility given per row as arrays of shape (rows,) or (rows, 1).
+        
+        Parameters:
+        -----------
+        S : float or np.ndarray
+            Current stock price
+        K : np.ndarray
+            Strike prices
+        T : float or np.ndarray
+            Time to expiry in years
+        r : float
+            Risk-free interest rate
+        sigma : float or np.ndarray
+            Volatility
+            
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+            Call prices, put prices, call deltas and put deltas, one per strike
+        """
+        K = np.asarray(K, dtype=np.float64)
+        self._validate_parameters(np.min(S), K.min(), np.min(T), np.min(sigma))
+        
+        # The compiled kernel prices one chain per row of strikes
+        K_rows = np.ascontiguousarray(np.atleast_2d(K))
+        rows = K_rows.shape[0]
+        S_rows, T_rows, sigma_rows = (
+            np.broadcast_to(np.asarray(x, dtype=np.float64).reshape(-1), (rows,)).copy()
+            for x in (S, T, sigma)
+        )
+        calls = np.empty_like(K_rows)
+        puts = np.empty_like(K_rows)
+        call_deltas = np.empty_like(K_rows)
+        black_scholes_chain(S_rows, K_rows, T_rows, r, sigma_rows, calls, puts, call_deltas)
+        
+        calls = calls.reshape(K.shape)
+        puts = puts.reshape(K.shape)
+        call_deltas = call_deltas.reshape(K.shape)
+        return calls, puts, call_deltas, call_deltas - 1.0
 
 def generate_option_chain(
     current_price: float,
@@ -121,31 +203,17 @@ def generate_option_chain(
     # Initialize pricing model
     model = BlackScholesModel()
     
-    # Calculate option prices for each strike
-    calls = []
-    puts = []
-    for K in strikes:
-        call_price = model.price_option(
-            S=current_price,
-            K=K,
-            T=T,
-            r=risk_free_rate,
-            sigma=volatility,
-            option_type=OptionType.CALL
-        )
-        put_price = model.price_option(
-            S=current_price,
-            K=K,
-            T=T,
-            r=risk_free_rate,
-            sigma=volatility,
-            option_type=OptionType.PUT
-        )
-        calls.append(call_price)
-        puts.append(put_price)
+    # Calculate option prices for all strikes
+    calls, puts = model.price_chain(
+        S=current_price,
+        K=strikes,
+        T=T,
+        r=risk_free_rate,
+        sigma=volatility
+    )
     
     return OptionChain(
-        strikes=strikes.tolist(),
+        strikes=strikes,
         calls=calls,
         puts=puts,
         expiry_days=days_to_expiry
@@ -1,11 +1,58 @@
+import json
 import os
 import pickle
+import zipfile
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, BinaryIO, Union
 from market_sim.storage.storage_interface import StorageInterface
 from market_sim.config.config_manager import ConfigManager
 
+# Dicts of arrays are stored as an uncompressed zip of .npy members behind this
+# header, so load recognises them explicitly instead of by sniffing zip magic
+_ARRAY_DICT_HEADER = b"MARKET_SIM_ARRAYS\x00\x01"
+
+# Parquet files start (and end) with these magic bytes
+_PARQUET_MAGIC = b"PAR1"
+
+
+def _is_array_dict(data: Any) -> bool:
+    """Whether data is a non-empty dict of plain NumPy arrays without object fields."""
+    return (
+        isinstance(data, dict)
+        and bool(data)
+        and all(isinstance(key, str) for key in data)
+        and all(type(value) is np.ndarray and not value.dtype.hasobject
+                for value in data.values())
+    )
+
+
+def _write_array_dict(f: BinaryIO, data: dict[str, np.ndarray]) -> None:
+    """Write a dict of arrays as the header followed by a zip of .npy members.
+
+    Members are numbered and the keys kept in a JSON list, so any string key
+    round-trips unchanged.
+    """
+    f.write(_ARRAY_DICT_HEADER)
+    with zipfile.ZipFile(f, mode='w', compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+        archive.writestr("keys.json", json.dumps(list(data)))
+        for i, value in enumerate(data.values()):
+            with archive.open(f"{i}.npy", mode='w', force_zip64=True) as member:
+                np.lib.format.write_array(member, value, allow_pickle=False)
+
+
+def _read_array_dict(f: BinaryIO) -> dict[str, np.ndarray]:
+    """Read a dict of arrays written by _write_array_dict, after its header."""
+    with zipfile.ZipFile(f) as archive:
+        keys = json.loads(archive.read("keys.json"))
+        data = {}
+        for i, key in enumerate(keys):
+            with archive.open(f"{i}.npy") as member:
+                data[key] = np.lib.format.read_array(member, allow_pickle=False)
+        return data
+
+
 class LocalStorage(StorageInterface):
     def __init__(self, config: ConfigManager):
         self.base_path = Path(config.local_storage_path)
@@ -16,7 +63,9 @@ class LocalStorage(StorageInterface):
         
         Args:
             filepath: Relative path where to save the data
-            data: Data to save (DataFrame or other pickle-able object)
+            data: Data to save (DataFrame or other pickle-able object).
+                DataFrames are written as parquet when filepath ends in .parquet,
+                dicts of plain arrays as an uncompressed archive of .npy buffers
             
         Returns:
             str: Full path where data was saved
@@ -24,12 +73,21 @@ class LocalStorage(StorageInterface):
         full_path = self.base_path / filepath
         full_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Handle both DataFrames and other objects
-        if isinstance(data, pd.DataFrame):
+        # Handle both DataFrames and other objects; DataFrames saved under a
+        # .parquet key are written as zstd-compressed columns
+        if isinstance(data, pd.DataFrame) and full_path.suffix == ".parquet":
+            data.to_parquet(full_path, engine="pyarrow", compression="zstd", index=True)
+        elif isinstance(data, pd.DataFrame):
             data.to_pickle(full_path)
+        elif _is_array_dict(data):
+            # Dicts of arrays are stored as raw array buffers, skipping pickle
+            with open(full_path, 'wb') as f:
+                _write_array_dict(f, data)
         else:
             with open(full_path, 'wb') as f:
-                pickle.dump(data, f)
+                # Protocol 5 writes array buffers straight to the file
+                # instead of copying them into an intermediate bytes object
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
                 
         return str(full_path)
 
@@ -49,6 +107,16 @@ class LocalStorage(StorageInterface):
         if not full_path.exists():
             raise KeyError(f"Key not found: {filepath}")
             
+        with open(full_path, 'rb') as f:
+            header = f.read(len(_ARRAY_DICT_HEADER))
+            if header == _ARRAY_DICT_HEADER:
+                return _read_array_dict(f)
+            
+        # Only DataFrames are written as parquet, so dispatch on the file's
+        # magic bytes rather than the key suffix
+        if header.startswith(_PARQUET_MAGIC):
+            return pd.read_parquet(full_path, engine="pyarrow", memory_map=True)
+
         try:
             # Try loading as DataFrame first
             return pd.read_pickle(full_path)
@@ -78,14 +146,24 @@ class LocalStorage(StorageInterface):
             list[str]: List of file paths in directory
         """
         dir_path = self.base_path / directory
-        if not dir_path.exists():
+        if not dir_path.is_dir():
             return []
             
-        files = []
-        for p in dir_path.glob("**/*"):
-            if p.is_file():
-                files.append(str(p.relative_to(self.base_path)))
-        return files
+        return [os.path.relpath(entry.path, self.base_path)
+                for entry in self._scan_files(dir_path)]
+
+    def _scan_files(self, dir_path: Union[str, Path]):
+        """Yield the directory entries of all files below dir_path.
+
+        scandir entries carry their file type, so walking the tree needs no
+        extra stat call per file.
+        """
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._scan_files(entry.path)
+                elif entry.is_file():
+                    yield entry
         
     def delete(self, filepath: str) -> bool:
         """Delete a file from storage.
@@ -112,9 +190,8 @@ class LocalStorage(StorageInterface):
             bool: True if all files were cleared, False otherwise
         """
         try:
-            for file in self.base_path.glob("**/*"):
-                if file.is_file():
-                    file.unlink()
+            for entry in list(self._scan_files(self.base_path)):
+                os.unlink(entry.path)
             return True
         except Exception:
             return False
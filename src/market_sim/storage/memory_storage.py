@@ -0,0 +1,94 @@
+import pandas as pd
+from typing import Any, Union
+from market_sim.storage.storage_interface import StorageInterface
+
+class MemoryStorage(StorageInterface):
+    """Dict-backed storage that keeps data in process memory."""
+
+    def __init__(self):
+        self._data: dict[str, Any] = {}
+
+    def save(self, filepath: str, data: Union[pd.DataFrame, Any]) -> str:
+        """Save data in memory.
+
+        Args:
+            filepath: Key to store the data under
+            data: Data to save
+
+        Returns:
+            str: Key the data was saved under
+        """
+        self._data[filepath] = data
+        return filepath
+
+    def load(self, filepath: str) -> Union[pd.DataFrame, Any]:
+        """Load data from memory.
+
+        Args:
+            filepath: Key to load data from
+
+        Returns:
+            Data stored under the key
+
+        Raises:
+            KeyError: If the key doesn't exist
+        """
+        if filepath not in self._data:
+            raise KeyError(f"Key not found: {filepath}")
+        return self._data[filepath]
+
+    def exists(self, filepath: str) -> bool:
+        """Check if a key exists in storage.
+
+        Args:
+            filepath: Key to check
+
+        Returns:
+            bool: True if the key exists, False otherwise
+        """
+        return filepath in self._data
+
+    def list_files(self, directory: str = "") -> list[str]:
+        """List keys under a directory prefix.
+
+        Args:
+            directory: Directory prefix to list
+
+        Returns:
+            list[str]: List of keys under the directory
+        """
+        if not directory:
+            return list(self._data)
+        prefix = directory.rstrip("/") + "/"
+        return [key for key in self._data if key.startswith(prefix)]
+
+    def delete(self, filepath: str) -> bool:
+        """Delete a key from storage.
+
+        Args:
+            filepath: Key to delete
+
+        Returns:
+            bool: True if the key was deleted, False otherwise
+        """
+        if filepath not in self._data:
+            return False
+        del self._data[filepath]
+        return True
+
+    def clear(self) -> bool:
+        """Clear all keys from storage.
+
+        Returns:
+            bool: True once all keys were cleared
+        """
+        self._data.clear()
+        return True
+
+    def list_keys(self) -> list[str]:
+        """List all keys in storage.
+
+        Returns:
+            list[str]: List of all keys
+        """
+        return self.list_files()
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from market_sim.models.gbm_model import GBMModel
+from market_sim.models.options import BlackScholesModel, OptionType, generate_option_chain
+
+
+@pytest.mark.benchmark(group="gbm")
+def test_gbm_perf(benchmark, config):
+    """Benchmark simulating 1000 one-year GBM paths."""
+    paths = benchmark(GBMModel(config).simulate, 100.0, 1.0, 252, 1000, seed=42)
+    assert paths.shape == (1000, 253)
+
+@pytest.mark.benchmark(group="options")
+def test_price_option_perf(benchmark):
+    """Benchmark pricing a single option."""
+    price = benchmark(
+        BlackScholesModel().price_option,
+        S=100.0, K=100.0, T=1.0, r=0.05, sigma=0.2, option_type=OptionType.CALL
+    )
+    assert price > 0
+
+@pytest.mark.benchmark(group="options")
+def test_option_chain_perf(benchmark):
+    """Benchmark generating a 50-strike option chain."""
+    chain = benchmark(
+        generate_option_chain,
+        current_price=100.0,
+        strike_range_percent=10,
+        num_strikes=50,
+        days_to_expiry=30,
+        volatility=0.2
+    )
+    assert np.all(chain.calls > 0)
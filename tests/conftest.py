@@ -0,0 +1,20 @@
+import pytest
+
+from market_sim.config.config_manager import ConfigManager
+
+
+@pytest.fixture(scope="session")
+def config(tmp_path_factory):
+    """Create test configuration once; the environment is restored afterwards."""
+    with pytest.MonkeyPatch.context() as mp:
+        for key, value in {
+            'STORAGE_TYPE': 'local',
+            'LOCAL_STORAGE_PATH': str(tmp_path_factory.mktemp("test_data")),
+            'DEFAULT_DRIFT': '0.05',
+            'DEFAULT_VOLATILITY': '0.2',
+            'DEFAULT_JUMP_INTENSITY': '1.0',
+            'DEFAULT_JUMP_MEAN': '0.0',
+            'DEFAULT_JUMP_VOLATILITY': '0.2'
+        }.items():
+            mp.setenv(key, value)
+        return ConfigManager()
@@ -0,0 +1,47 @@
+import pytest
+from pydantic import ValidationError
+
+from market_sim.api.schemas import MarkovJumpSimulationRequest
+
+
+def _markov_request(**overrides):
+    payload = {
+        "initial_value": 100.0,
+        "time_period_days": 30,
+        "storage_type": "LOCAL",
+        "output_path": "test_markov",
+        "regimes": [
+            {"name": "calm", "mu": 0.05, "sigma": 0.1, "theta": 0.5},
+            {"name": "stressed", "mu": -0.02, "sigma": 0.3, "theta": 1.0},
+        ],
+        "transition_matrix": [[0.9, 0.1], [0.2, 0.8]],
+        "steps": 10,
+        "lambda_jump": 0.1,
+        "mu_jump": 0.0,
+        "sigma_jump": 0.05,
+    }
+    payload.update(overrides)
+    return MarkovJumpSimulationRequest(**payload)
+
+
+def test_markov_request_valid():
+    request = _markov_request()
+    assert len(request.regimes) == len(request.transition_matrix) == 2
+
+
+@pytest.mark.parametrize(
+    "overrides, message",
+    [
+        ({"transition_matrix": []}, "transition_matrix must not be empty"),
+        ({"transition_matrix": [[1.0, 0.0]]}, "must be square"),
+        ({"transition_matrix": [[0.5, 0.4], [0.2, 0.8]]}, "Row 0 must sum to 1"),
+        (
+            {"regimes": [{"name": "calm", "mu": 0.05, "sigma": 0.1, "theta": 0.5}]},
+            "Number of regimes must equal matrix dimension",
+        ),
+    ],
+    ids=["empty_matrix", "non_square", "bad_row_sum", "regime_mismatch"],
+)
+def test_markov_request_invalid_config(overrides, message):
+    with pytest.raises(ValidationError, match=message):
+        _markov_request(**overrides)
@@ -0,0 +1,126 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_sim.api.schemas import (
+    MarketSimulationRequest,
+    MarketType,
+    MarkovJumpSimulationRequest,
+    StorageType
+)
+from market_sim.api.simulation_service import SimulationService
+from market_sim.models.gbm_jd_model import GBM_JD_Model
+from market_sim.models.gbm_model import GBMModel
+from market_sim.models.jump_diffusion_model import JumpDiffusionModel
+from market_sim.storage.local_storage import LocalStorage
+
+
+@pytest.fixture
+def service(config, monkeypatch):
+    """Simulation service wired to the shared test configuration."""
+    monkeypatch.setattr("market_sim.api.simulation_service.get_config", lambda: config)
+    return SimulationService()
+
+@pytest.fixture
+def seeded_gbm(monkeypatch):
+    """Fix the seed of every GBM run; the service itself simulates unseeded."""
+    get_rng = GBMModel._get_rng
+    monkeypatch.setattr(GBMModel, "_get_rng", lambda self, seed=None: get_rng(self, 42))
+
+def _gbm_request(output_path):
+    return MarketSimulationRequest(
+        initial_value=18000.0,
+        market_type=MarketType.GBM,
+        volatility=0.2,
+        time_period_days=21,
+        storage_type=StorageType.LOCAL,
+        output_path=output_path
+    )
+
+def _markov_request(**overrides):
+    payload = {
+        "initial_value": 18000.0,
+        "time_period_days": 1,
+        "storage_type": "LOCAL",
+        "output_path": "markov_run",
+        "regimes": [
+            {"name": "bull", "mu": 0.1, "sigma": 0.2, "theta": 0.0},
+            {"name": "bear", "mu": -0.1, "sigma": 0.3, "theta": 0.1}
+        ],
+        "transition_matrix": [[0.9, 0.1], [0.2, 0.8]],
+        "steps": 5,
+        "lambda_jump": 50.0,
+        "mu_jump": 0.0,
+        "sigma_jump": 0.01
+    }
+    payload.update(overrides)
+    return MarkovJumpSimulationRequest(**payload)
+
+@pytest.mark.parametrize("market_type, model_class", [
+    (MarketType.GBM, GBMModel),
+    (MarketType.VOLATILE, JumpDiffusionModel),
+    (MarketType.BULLISH, GBM_JD_Model),
+    (MarketType.BEARISH, GBM_JD_Model),
+    (MarketType.RANGE_BOUND, GBM_JD_Model),
+    ("DEFAULT", GBM_JD_Model),
+], ids=["gbm", "volatile", "bullish", "bearish", "range_bound", "unmapped"])
+def test_create_model_dispatch(service, config, market_type, model_class):
+    """Test each market type maps to its model and unmapped types fall back."""
+    model = service._create_model(market_type)
+    
+    assert type(model) is model_class
+    assert model.config is config
+
+def test_start_market_data_simulation_saves_index_and_options(service, config):
+    """Test the Markov simulation stores both frames and completes its status."""
+    storage_path = asyncio.run(
+        service.start_market_data_simulation("markov-1", _markov_request())
+    )
+    
+    assert storage_path == "markov_run"
+    storage = LocalStorage(config)
+    index = storage.load("markov_run/index.parquet")
+    options = storage.load("markov_run/options.parquet")
+    assert isinstance(index, pd.DataFrame) and len(index) > 0
+    assert isinstance(options, pd.DataFrame) and len(options) > 0
+    
+    status = service.get_status("markov-1")
+    assert status.status == "completed"
+    assert status.progress == 100.0
+    assert status.storage_path == "markov_run"
+    assert status.error_message is None
+
+def test_start_market_data_simulation_rejects_unknown_storage_type(service):
+    """Test an unknown storage type fails the run and records the error."""
+    params = _markov_request(storage_type="S3", output_path="markov_bad")
+    
+    with pytest.raises(ValueError, match="S3"):
+        asyncio.run(service.start_market_data_simulation("markov-2", params))
+    
+    status = service.get_status("markov-2")
+    assert status.status == "failed"
+    assert "S3" in status.error_message
+    assert status.storage_path is None
+
+@pytest.mark.parametrize("run_in_thread", [False, True], ids=["sync", "to_thread"])
+def test_start_simulation_gbm(service, config, seeded_gbm, run_in_thread):
+    """Test both simulation entry points store the seeded GBM path and complete."""
+    output_path = f"gbm_{'async' if run_in_thread else 'sync'}.pkl"
+    params = _gbm_request(output_path)
+    
+    if run_in_thread:
+        storage_path = asyncio.run(service.start_simulation("gbm-1", params))
+    else:
+        storage_path = service.start_simulation_sync("gbm-1", params)
+    
+    assert storage_path == output_path
+    result = LocalStorage(config).load(output_path)
+    expected = GBMModel(config).simulate(18000.0, 21 / 252, 21, 1, seed=42)[0]
+    np.testing.assert_array_equal(result["price"].to_numpy(), expected)
+    
+    status = service.get_status("gbm-1")
+    assert status.status == "completed"
+    assert status.progress == 100.0
+    assert status.error_message is None
@@ -3,7 +3,7 @@ from unittest.mock import patch
 
 import pytest
 
-from market_sim.config.config_manager import ConfigManager
+from market_sim.config.config_manager import ConfigManager, get_config
 
 
 def test_load_config_from_env():
@@ -19,23 +19,30 @@ def test_load_config_from_env():
         assert config.default_drift == 0.05
         assert config.default_volatility == 0.2
 
-def test_missing_required_config():
-    with patch.dict(os.environ, {}, clear=True):
-        with pytest.raises(ValueError) as exc_info:
-            ConfigManager()
-        assert "Missing required configuration" in str(exc_info.value)
-
-def test_invalid_storage_type():
-    with patch.dict(os.environ, {'STORAGE_TYPE': 'invalid'}):
+@pytest.mark.parametrize("env, message", [
+    ({}, "Missing required configuration"),
+    ({'STORAGE_TYPE': 'invalid'}, "Invalid storage type"),
+    ({
+        'STORAGE_TYPE': 'local',
+        'LOCAL_STORAGE_PATH': './test_data',
+        'DEFAULT_VOLATILITY': '0.2',
+        'DEFAULT_DRIFT': 'not_a_number'
+    }, "Invalid numeric value"),
+], ids=["missing_required_config", "invalid_storage_type", "invalid_numeric_values"])
+def test_invalid_config(env, message):
+    with patch.dict(os.environ, env, clear=True):
         with pytest.raises(ValueError) as exc_info:
             ConfigManager()
-        assert "Invalid storage type" in str(exc_info.value)
+        assert message in str(exc_info.value)
 
-def test_invalid_numeric_values():
+def test_get_config_is_cached():
+    get_config.cache_clear()
     with patch.dict(os.environ, {
         'STORAGE_TYPE': 'local',
-        'DEFAULT_DRIFT': 'not_a_number'
+        'LOCAL_STORAGE_PATH': './test_data',
+        'DEFAULT_DRIFT': '0.05',
+        'DEFAULT_VOLATILITY': '0.2'
     }):
-        with pytest.raises(ValueError) as exc_info:
-            ConfigManager()
-        assert "Invalid numeric value" in str(exc_info.value)
\ No newline at end of file
+        config = get_config()
+        assert get_config() is config
+    get_config.cache_clear()
@@ -1,37 +1,36 @@
+import math
+import os
+import subprocess
+import sys
+import textwrap
+
 import numpy as np
+import pandas as pd
 import pytest
 
+from market_sim.api.schemas import MarkovJumpSimulationRequest
 from market_sim.models.base_model import BaseModel
+from market_sim.models.gbm_jd_model import GBM_JD_Model
 from market_sim.models.gbm_model import GBMModel
 from market_sim.models.jump_diffusion_model import JumpDiffusionModel
+from market_sim.models.kernels import gbm_paths, jump_diffusion_paths, regime_jump_bars
 from market_sim.config.config_manager import ConfigManager
 
 
-@pytest.fixture
-def config():
-    """Create test configuration."""
-    import os
-    os.environ.update({
-        'STORAGE_TYPE': 'local',
-        'LOCAL_STORAGE_PATH': './test_data',
-        'DEFAULT_DRIFT': '0.05',
-        'DEFAULT_VOLATILITY': '0.2',
-        'DEFAULT_JUMP_INTENSITY': '1.0',
-        'DEFAULT_JUMP_MEAN': '0.0',
-        'DEFAULT_JUMP_VOLATILITY': '0.2'
-    })
-    return ConfigManager()
-
-def test_gbm_model_simulation(config):
+@pytest.fixture(scope="module")
+def gbm_simulation(config):
+    """Simulate 1000 one-year GBM paths once, read-only so tests can share them."""
+    simulated_paths = GBMModel(config).simulate(100.0, 1.0, 252, 1000, seed=42)
+    simulated_paths.setflags(write=False)
+    return simulated_paths
+
+def test_gbm_model_simulation(config, gbm_simulation):
     """Test GBM model simulation."""
-    model = GBMModel(config)
     S0 = 100.0
     T = 1.0
     n_steps = 252
     paths = 1000
-    
-    # Simulate multiple paths
-    simulated_paths = model.simulate(S0, T, n_steps, paths)
+    simulated_paths = gbm_simulation
     
     # Check shape
     assert simulated_paths.shape == (paths, n_steps + 1)
@@ -40,19 +39,77 @@ def test_gbm_model_simulation(config):
     np.testing.assert_array_equal(simulated_paths[:, 0], S0)
     
     # Check that values are positive
-    assert np.all(simulated_paths > 0)
+    assert simulated_paths.min() > 0.0
+    
+    # Check statistical properties (approximate) from the terminal log-returns
+    log_returns = np.log(simulated_paths[:, -1] / S0)
+    emp_drift = log_returns.mean() / T
+    emp_vol = math.sqrt(log_returns.var(ddof=1) / T)
     
-    # Check statistical properties (approximate)
-    final_values = simulated_paths[:, -1]
-    log_returns = np.log(final_values / S0)
+    # Check against the log drift mu - sigma^2/2, within ~4 standard errors
+    expected_drift = config.default_drift - 0.5 * config.default_volatility**2
+    assert abs(emp_drift - expected_drift) < 0.03
+    assert abs(emp_vol - config.default_volatility) < 0.02
+
+def test_seeded_simulation_is_reproducible(config):
+    """Test that a seed fixes the simulated paths."""
+    model = GBMModel(config)
     
-    # Calculate empirical drift and volatility
-    emp_drift = np.mean(log_returns) / T
-    emp_vol = np.std(log_returns) / np.sqrt(T)
+    first = model.simulate(100.0, 1.0, 252, 10, seed=42)
+    second = model.simulate(100.0, 1.0, 252, 10, seed=42)
     
-    # Check if empirical values are within reasonable bounds
-    assert abs(emp_drift - config.default_drift) < 0.1
-    assert abs(emp_vol - config.default_volatility) < 0.1
+    np.testing.assert_array_equal(first, second)
+
+def test_gbm_paths_kernel():
+    """Test compiled GBM kernel against the vectorized closed form."""
+    S0 = 100.0
+    drift = 0.0001
+    vol = 0.01
+    Z = np.random.normal(size=(50, 252))
+    
+    paths = gbm_paths(S0, drift, vol, Z, np.empty((50, 253)))
+    
+    expected = S0 * np.exp(np.cumsum(drift + vol * Z, axis=1))
+    np.testing.assert_array_equal(paths[:, 0], S0)
+    np.testing.assert_allclose(paths[:, 1:], expected, rtol=1e-10)
+
+def test_jump_diffusion_paths_kernel():
+    """Test compiled jump-diffusion kernel against the vectorized closed form."""
+    S0 = 100.0
+    drift = 0.0001
+    vol = 0.01
+    Z = np.random.normal(size=(50, 252))
+    jumps = np.random.poisson(0.05, size=(50, 252)) * np.random.normal(0.0, 0.05, size=(50, 252))
+    
+    paths = jump_diffusion_paths(S0, drift, vol, Z, jumps, np.empty((50, 253)))
+    
+    expected = S0 * np.exp(np.cumsum(drift + vol * Z + jumps, axis=1))
+    np.testing.assert_array_equal(paths[:, 0], S0)
+    np.testing.assert_allclose(paths[:, 1:], expected, rtol=1e-10)
+
+def test_regime_jump_bars_kernel():
+    """Test compiled regime-switching bar kernel invariants."""
+    n_bars, steps, sma_length = 500, 4, 30
+    transition_cdf = np.cumsum([[0.9, 0.1], [0.2, 0.8]], axis=1)
+    
+    opens, highs, lows, closes, regimes, sigmas, ema = regime_jump_bars(
+        18000.0, np.array([0.1, -0.1]), np.array([0.2, 0.3]), transition_cdf,
+        0.05, 1.0 / (252 * 375 * steps), sma_length,
+        np.random.uniform(size=n_bars), np.random.normal(size=n_bars),
+        np.random.normal(0, 3, size=n_bars), np.random.normal(size=(n_bars, steps)),
+        np.random.uniform(size=n_bars), np.random.normal(0, 0.01, size=n_bars)
+    )
+    
+    # Bars chain together and stay within their high/low range
+    np.testing.assert_array_equal(opens[1:], closes[:-1])
+    assert np.all(highs >= np.maximum(opens, closes))
+    assert np.all(lows <= np.minimum(opens, closes))
+    assert set(np.unique(regimes)) <= {0, 1}
+    
+    # EMA matches pandas on closes up to the previous bar
+    expected = pd.Series(closes).ewm(span=sma_length, adjust=False).mean().shift(1)
+    expected[:sma_length] = np.nan
+    np.testing.assert_allclose(ema, expected.to_numpy(), rtol=1e-10)
 
 def test_jump_diffusion_model_simulation(config):
     """Test Jump-Diffusion model simulation."""
@@ -63,45 +120,139 @@ def test_jump_diffusion_model_simulation(config):
     paths = 1000
     
     # Simulate multiple paths
-    simulated_paths = model.simulate(S0, T, n_steps, paths)
+    simulated_paths = model.simulate(S0, T, n_steps, paths, seed=42)
     
     # Basic checks
     assert simulated_paths.shape == (paths, n_steps + 1)
-    assert np.all(simulated_paths > 0)
+    assert simulated_paths.min() > 0.0
     np.testing.assert_array_equal(simulated_paths[:, 0], S0)
     
     # Check for jumps
-    daily_returns = np.diff(simulated_paths) / simulated_paths[:, :-1]
+    daily_returns = np.diff(simulated_paths)
+    daily_returns /= simulated_paths[:, :-1]
     large_moves = np.abs(daily_returns) > 3 * config.default_volatility / np.sqrt(252)
     
     # There should be some large moves due to jumps
     assert np.any(large_moves)
 
-def test_invalid_parameters():
+def test_invalid_parameters(monkeypatch):
     """Test model behavior with invalid parameters."""
-    import os
-    os.environ.update({
+    for key, value in {
         'STORAGE_TYPE': 'local',
         'LOCAL_STORAGE_PATH': './test_data',
         'DEFAULT_DRIFT': '-2.0',  # Invalid drift
         'DEFAULT_VOLATILITY': '-0.2',  # Invalid volatility
-    })
+    }.items():
+        monkeypatch.setenv(key, value)
     
     with pytest.raises(ValueError):
         ConfigManager()
 
-def test_model_validation():
+@pytest.mark.parametrize("S0, T, n_steps, paths", [
+    (-100.0, 1.0, 252, 100),
+    (100.0, -1.0, 252, 100),
+    (100.0, 1.0, -252, 100),
+    (100.0, 1.0, 252, -100),
+], ids=["negative_price", "negative_horizon", "negative_steps", "negative_paths"])
+def test_model_validation(S0, T, n_steps, paths):
     """Test model parameter validation."""
-    model = GBMModel(config)
-    
     with pytest.raises(ValueError):
-        model.simulate(S0=-100.0, T=1.0, n_steps=252, paths=100)
+        BaseModel._validate_parameters(S0=S0, T=T, n_steps=n_steps, paths=paths)
+
+def test_gbm_jd_seeded_simulation_is_reproducible(config):
+    """Test that a seed fixes the regime-switching index and options output."""
+    model = GBM_JD_Model(config)
+    params = MarkovJumpSimulationRequest(
+        initial_value=18000.0,
+        time_period_days=1,
+        storage_type="LOCAL",
+        output_path="test",
+        regimes=[
+            {"name": "bull", "mu": 0.1, "sigma": 0.2, "theta": 0.0},
+            {"name": "bear", "mu": -0.1, "sigma": 0.3, "theta": 0.1}
+        ],
+        transition_matrix=[[0.9, 0.1], [0.2, 0.8]],
+        steps=5,
+        lambda_jump=50.0,
+        mu_jump=0.0,
+        sigma_jump=0.01
+    )
     
-    with pytest.raises(ValueError):
-        model.simulate(S0=100.0, T=-1.0, n_steps=252, paths=100)
+    index, options = model.simulate(params, seed=7)
+    index_again, options_again = model.simulate(params, seed=7)
     
-    with pytest.raises(ValueError):
-        model.simulate(S0=100.0, T=1.0, n_steps=-252, paths=100)
+    pd.testing.assert_frame_equal(index, index_again)
+    pd.testing.assert_frame_equal(options, options_again)
+    assert len(options) == (len(index) - 1) * 100
+
+def test_parallel_kernels_survive_concurrent_threads():
+    """Test concurrent to_thread simulations under Numba's non-threadsafe workqueue layer."""
+    script = textwrap.dedent("""
+        import asyncio
+        import numpy as np
+        from market_sim.config.config_manager import ConfigManager
+        from market_sim.models.gbm_model import GBMModel
+        from market_sim.models.jump_diffusion_model import JumpDiffusionModel
+        from market_sim.models.options import BlackScholesModel
+
+        config = ConfigManager()
+        gbm, jump = GBMModel(config), JumpDiffusionModel(config)
+        pricer = BlackScholesModel()
+        strikes = np.linspace(80.0, 120.0, 50)
+
+        async def main():
+            for _ in range(3):
+                await asyncio.gather(*(
+                    task
+                    for seed in range(4)
+                    for task in (
+                        asyncio.to_thread(gbm.simulate, 100.0, 1.0, 252, 500, seed=seed),
+                        asyncio.to_thread(jump.simulate, 100.0, 1.0, 252, 500, seed=seed),
+                        asyncio.to_thread(pricer.price_chain, 100.0, strikes, 0.5, 0.05, 0.2),
+                    )
+                ))
+
+        asyncio.run(main())
+    """)
+    env = dict(
+        os.environ,
+        NUMBA_THREADING_LAYER="workqueue",
+        PYTHONPATH=os.pathsep.join(sys.path),
+        STORAGE_TYPE="local",
+        LOCAL_STORAGE_PATH="./test_data",
+        DEFAULT_DRIFT="0.05",
+        DEFAULT_VOLATILITY="0.2"
+    )
     
-    with pytest.raises(ValueError):
-        model.simulate(S0=100.0, T=1.0, n_steps=252, paths=-100)
\ No newline at end of file
+    result = subprocess.run([sys.executable, "-c", script], env=env,
+                            capture_output=True, text=True, timeout=600)
+    
+    assert result.returncode == 0, result.stderr
+
+def test_worker_thread_simulation_lets_process_exit():
+    """Test that a to_thread simulation under Numba's default layer does not hang shutdown."""
+    script = textwrap.dedent("""
+        import asyncio
+        from market_sim.config.config_manager import ConfigManager
+        from market_sim.models.gbm_model import GBMModel
+
+        model = GBMModel(ConfigManager())
+        asyncio.run(asyncio.to_thread(model.simulate, 100.0, 1.0, 252, 100, seed=1))
+    """)
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join(sys.path),
+        STORAGE_TYPE="local",
+        LOCAL_STORAGE_PATH="./test_data",
+        DEFAULT_DRIFT="0.05",
+        DEFAULT_VOLATILITY="0.2"
+    )
+    env.pop("NUMBA_THREADING_LAYER", None)
+    
+    try:
+        result = subprocess.run([sys.executable, "-c", script], env=env,
+                                capture_output=True, text=True, timeout=180)
+    except subprocess.TimeoutExpired:
+        pytest.fail("interpreter did not exit after a worker-thread simulation")
+    
+    assert result.returncode == 0, result.stderr
@@ -1,5 +1,6 @@
 import numpy as np
 import pytest
+from scipy.stats import norm
 from datetime import datetime, timedelta
 
 from market_sim.models.options import (
@@ -46,6 +47,84 @@ def test_black_scholes_put_price():
     expected_value = 5.57
     assert abs(put_price - expected_value) < 0.1
 
+def test_price_chain_matches_price_option():
+    """Test vectorized chain pricing against per-strike pricing."""
+    model = BlackScholesModel()
+    strikes = np.linspace(80.0, 120.0, 9)
+    
+    calls, puts = model.price_chain(S=100.0, K=strikes, T=0.5, r=0.05, sigma=0.2)
+    
+    for K, call, put in zip(strikes, calls, puts):
+        assert call == pytest.approx(model.price_option(
+            S=100.0, K=K, T=0.5, r=0.05, sigma=0.2, option_type=OptionType.CALL
+        ))
+        assert put == pytest.approx(model.price_option(
+            S=100.0, K=K, T=0.5, r=0.05, sigma=0.2, option_type=OptionType.PUT
+        ))
+
+def test_price_chain_matches_closed_form():
+    """Test the compiled chain pricer against the textbook formula, tails included."""
+    model = BlackScholesModel()
+    S, T, r, sigma = 100.0, 0.25, 0.05, 0.2
+    strikes = np.linspace(50.0, 200.0, 31)
+    
+    calls, puts = model.price_chain(S=S, K=strikes, T=T, r=r, sigma=sigma)
+    
+    d1 = (np.log(S / strikes) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+    d2 = d1 - sigma * np.sqrt(T)
+    discounted_K = strikes * np.exp(-r * T)
+    np.testing.assert_allclose(calls, S * norm.cdf(d1) - discounted_K * norm.cdf(d2), rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(puts, discounted_K * norm.cdf(-d2) - S * norm.cdf(-d1), rtol=1e-9)
+
+def test_price_chain_deep_otm_puts_keep_relative_precision():
+    """Test deep out-of-the-money puts against the textbook formula in relative terms."""
+    model = BlackScholesModel()
+    S, T, r, sigma = 100.0, 0.25, 0.05, 0.2
+    strikes = np.linspace(30.0, 80.0, 26)
+    
+    _, puts = model.price_chain(S=S, K=strikes, T=T, r=r, sigma=sigma)
+    
+    d1 = (np.log(S / strikes) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+    d2 = d1 - sigma * np.sqrt(T)
+    expected = strikes * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
+    assert (puts >= 0.0).all()
+    np.testing.assert_allclose(puts, expected, rtol=1e-9, atol=0.0)
+
+def test_price_chain_with_delta():
+    """Test chain deltas against a central finite difference of the prices."""
+    model = BlackScholesModel()
+    strikes = np.linspace(80.0, 120.0, 9)
+    h = 1e-4
+    
+    calls, puts, call_deltas, put_deltas = model.price_chain_with_delta(
+        S=100.0, K=strikes, T=0.5, r=0.05, sigma=0.2
+    )
+    calls_up, puts_up = model.price_chain(S=100.0 + h, K=strikes, T=0.5, r=0.05, sigma=0.2)
+    calls_down, puts_down = model.price_chain(S=100.0 - h, K=strikes, T=0.5, r=0.05, sigma=0.2)
+    
+    np.testing.assert_allclose(call_deltas, (calls_up - calls_down) / (2 * h), atol=1e-6)
+    np.testing.assert_allclose(put_deltas, (puts_up - puts_down) / (2 * h), atol=1e-6)
+    np.testing.assert_allclose(put_deltas, call_deltas - 1.0)
+
+def test_price_chain_with_delta_broadcasts_over_bars():
+    """Test pricing a (bars, strikes) grid in one call against per-bar calls."""
+    model = BlackScholesModel()
+    spots = np.array([95.0, 100.0, 105.0])
+    expiries = np.array([0.25, 0.5, 0.75])
+    sigmas = np.array([0.15, 0.2, 0.25])
+    strike_grid = np.round(spots)[:, None] + np.arange(-10.0, 15.0, 5.0)
+    
+    grid_results = model.price_chain_with_delta(
+        S=spots[:, None], K=strike_grid, T=expiries[:, None], r=0.05, sigma=sigmas[:, None]
+    )
+    
+    for bar in range(len(spots)):
+        bar_results = model.price_chain_with_delta(
+            S=spots[bar], K=strike_grid[bar], T=expiries[bar], r=0.05, sigma=sigmas[bar]
+        )
+        for grid_values, bar_values in zip(grid_results, bar_results):
+            np.testing.assert_allclose(grid_values[bar], bar_values)
+
 def test_generate_option_chain():
     """Test option chain generation."""
     current_price = 100.0
@@ -64,9 +143,9 @@ def test_generate_option_chain():
     
     # Verify structure and values
     assert isinstance(chain, OptionChain)
-    assert len(chain.strikes) == num_strikes
-    assert len(chain.calls) == num_strikes
-    assert len(chain.puts) == num_strikes
+    assert chain.strikes.shape == (num_strikes,)
+    assert chain.calls.shape == (num_strikes,)
+    assert chain.puts.shape == (num_strikes,)
     
     # Verify strike range
     min_strike = current_price * (1 - strike_range_percent/100)
@@ -75,21 +154,18 @@ def test_generate_option_chain():
     assert chain.strikes[-1] <= max_strike
     
     # Verify option prices are reasonable
-    assert all(call > 0 for call in chain.calls)
-    assert all(put > 0 for put in chain.puts)
+    assert (chain.calls > 0).all()
+    assert (chain.puts > 0).all()
 
-def test_invalid_parameters():
+@pytest.mark.parametrize("S, K, T, sigma", [
+    (-100, 100, 1, 0.2),
+    (100, -100, 1, 0.2),
+    (100, 100, -1, 0.2),
+    (100, 100, 1, -0.2),
+], ids=["negative_spot", "negative_strike", "negative_expiry", "negative_volatility"])
+def test_invalid_parameters(S, K, T, sigma):
     """Test parameter validation."""
     model = BlackScholesModel()
     
     with pytest.raises(ValueError):
-        model.price_option(S=-100, K=100, T=1, r=0.05, sigma=0.2, option_type=OptionType.CALL)
-    
-    with pytest.raises(ValueError):
-        model.price_option(S=100, K=-100, T=1, r=0.05, sigma=0.2, option_type=OptionType.CALL)
-    
-    with pytest.raises(ValueError):
-        model.price_option(S=100, K=100, T=-1, r=0.05, sigma=0.2, option_type=OptionType.CALL)
-    
-    with pytest.raises(ValueError):
-        model.price_option(S=100, K=100, T=1, r=0.05, sigma=-0.2, option_type=OptionType.CALL)
\ No newline at end of file
+        model.price_option(S=S, K=K, T=T, r=0.05, sigma=sigma, option_type=OptionType.CALL)
@@ -1,25 +1,25 @@
-import os
 from pathlib import Path
 import pickle
 import pytest
 import numpy as np
+import pandas as pd
 
 from market_sim.storage.storage_interface import StorageInterface
 from market_sim.storage.local_storage import LocalStorage
-from market_sim.config.config_manager import ConfigManager
+from market_sim.storage.memory_storage import MemoryStorage
 
 @pytest.fixture
-def test_data_path(tmp_path):
-    return str(tmp_path / "test_data")
+def local_storage(config):
+    storage = LocalStorage(config)
+    yield storage
+    storage.clear()
 
-@pytest.fixture
-def local_storage(test_data_path):
-    os.environ['STORAGE_TYPE'] = 'local'
-    os.environ['LOCAL_STORAGE_PATH'] = test_data_path
-    os.environ['DEFAULT_DRIFT'] = '0.05'
-    os.environ['DEFAULT_VOLATILITY'] = '0.2'
-    config = ConfigManager()
-    return LocalStorage(config)
+@pytest.fixture(params=["local", "memory"])
+def storage(request):
+    """Storage backends for tests of the key-management API."""
+    if request.param == "memory":
+        return MemoryStorage()
+    return request.getfixturevalue("local_storage")
 
 def test_local_storage_save_load(local_storage):
     # Test data
@@ -40,38 +40,109 @@ def test_local_storage_save_load(local_storage):
     np.testing.assert_array_equal(loaded_data['prices'], data['prices'])
     np.testing.assert_array_equal(loaded_data['timestamps'], data['timestamps'])
 
+@pytest.mark.parametrize("data", [
+    {'file': np.array([1.0, 2.0]), 'allow_pickle': np.array([3, 4])},
+    {'masked': np.ma.masked_array([1.0, 2.0, 3.0], mask=[False, True, False])},
+    {'records': np.array([(1, 'a'), (2, 'b')], dtype=[('id', 'i8'), ('tag', 'O')])},
+    {'': np.zeros((2, 2), dtype=np.int8), 'nested/key.npy': np.array(['x', 'yy'])},
+], ids=["reserved_savez_names", "masked_array", "object_field_dtype", "unusual_keys"])
+def test_local_storage_array_dict_round_trip(local_storage, data):
+    local_storage.save('arrays', data)
+    loaded_data = local_storage.load('arrays')
+    
+    assert list(loaded_data) == list(data)
+    for key, value in data.items():
+        assert type(loaded_data[key]) is type(value)
+        np.testing.assert_array_equal(loaded_data[key], value)
+        if isinstance(value, np.ma.MaskedArray):
+            np.testing.assert_array_equal(loaded_data[key].mask, value.mask)
+
+def test_local_storage_zip_dataframe_round_trip(local_storage):
+    data = pd.DataFrame({'Close': [100.0, 101.5]})
+    
+    local_storage.save('frame.zip', data)
+    
+    pd.testing.assert_frame_equal(local_storage.load('frame.zip'), data)
+
+def test_local_storage_mixed_dict_uses_pickle(local_storage):
+    data = {'prices': np.array([100.0, 101.0]), 'symbol': 'NIFTY'}
+    
+    local_storage.save('mixed', data)
+    loaded_data = local_storage.load('mixed')
+    
+    assert loaded_data['symbol'] == 'NIFTY'
+    np.testing.assert_array_equal(loaded_data['prices'], data['prices'])
+
+def test_local_storage_parquet_round_trip(local_storage):
+    data = pd.DataFrame({
+        'Strike': np.array([22000, 22000, 22050, 22050]),
+        'StrikeType': pd.Categorical(['CE', 'PE', 'CE', 'PE']),
+        'Close': np.array([120.5, 80.25, 95.0, 104.75])
+    })
+    
+    key = 'options.parquet'
+    local_storage.save(key, data)
+    
+    pd.testing.assert_frame_equal(local_storage.load(key), data)
+
+def test_local_storage_non_dataframe_under_parquet_key(local_storage):
+    data = {'prices': np.array([100.0, 101.0]), 'symbol': 'NIFTY'}
+    
+    local_storage.save('result.parquet', data)
+    loaded_data = local_storage.load('result.parquet')
+    
+    assert loaded_data['symbol'] == 'NIFTY'
+    np.testing.assert_array_equal(loaded_data['prices'], data['prices'])
+
 def test_local_storage_nonexistent_key(local_storage):
     with pytest.raises(KeyError):
         local_storage.load('nonexistent_key')
 
-def test_local_storage_list_keys(local_storage):
+def test_storage_list_keys(storage):
     # Save multiple datasets
     data = {'test': np.array([1.0, 2.0])}
-    local_storage.save('test1', data)
-    local_storage.save('test2', data)
+    storage.save('test1', data)
+    storage.save('test2', data)
     
     # List keys
-    keys = local_storage.list_keys()
+    keys = storage.list_keys()
     assert isinstance(keys, list)
     assert 'test1' in keys
     assert 'test2' in keys
 
-def test_local_storage_delete(local_storage):
+def test_storage_list_nested_keys(storage):
+    data = {'test': np.array([1.0, 2.0])}
+    storage.save('run/index', data)
+    storage.save('run/options', data)
+    
+    assert sorted(storage.list_files('run')) == ['run/index', 'run/options']
+    
+    storage.clear()
+    assert storage.list_keys() == []
+
+def test_storage_list_files_of_file_key(storage):
+    data = {'test': np.array([1.0, 2.0])}
+    storage.save('run/index', data)
+    
+    assert storage.list_files('run/index') == []
+    assert storage.list_files('missing') == []
+
+def test_storage_delete(storage):
     # Save and then delete data
     data = {'test': np.array([1.0, 2.0])}
     key = 'test_delete'
-    local_storage.save(key, data)
-    assert key in local_storage.list_keys()
+    storage.save(key, data)
+    assert key in storage.list_keys()
     
-    local_storage.delete(key)
-    assert key not in local_storage.list_keys()
+    storage.delete(key)
+    assert key not in storage.list_keys()
 
-def test_local_storage_clear(local_storage):
+def test_storage_clear(storage):
     # Save multiple datasets
     data = {'test': np.array([1.0, 2.0])}
-    local_storage.save('test1', data)
-    local_storage.save('test2', data)
+    storage.save('test1', data)
+    storage.save('test2', data)
     
     # Clear all data
-    local_storage.clear()
-    assert len(local_storage.list_keys()) == 0
\ No newline at end of file
+    storage.clear()
+    assert len(storage.list_keys()) == 0
\ No newline at end of file